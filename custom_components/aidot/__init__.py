@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from .helpers import PatchedAidotClient as AidotClient
+from .helpers import PatchedAidotClient as AidotClient, parse_model_id
 from aidot.exceptions import AidotAuthFailed
 
 from homeassistant.config_entries import ConfigEntry
@@ -20,6 +20,7 @@ from .const import (
     DOMAIN,
     CONF_SELECTED_HOUSE,
 )
+from .coordinator import AidotCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,43 +30,57 @@ PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SWITCH]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up aidot from a config entry."""
 
-    hass.data.setdefault(DOMAIN, {})[CONF_DEVICE_LIST] = entry.data[CONF_DEVICE_LIST]
-    hass.data.setdefault(DOMAIN, {})[CONF_LOGIN_INFO] = entry.data[CONF_LOGIN_INFO]
-    hass.data.setdefault(DOMAIN, {})[CONF_PRODUCT_LIST] = entry.data[CONF_PRODUCT_LIST]
+    domain_data = hass.data.setdefault(DOMAIN, {})
 
+    login_info = entry.data[CONF_LOGIN_INFO]
     devices = entry.data[CONF_DEVICE_LIST]
-    products = entry.data.get(CONF_PRODUCT_LIST, [])
+    products = entry.data.get(CONF_PRODUCT_LIST) or ()
 
-    _LOGGER.debug(f"Devices: {devices}")
-    _LOGGER.debug(f"Products: {products}")
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Devices: %s", devices)
+        _LOGGER.debug("Products: %s", products)
 
-    for product in products:
-        for device in devices:
-            if device["productId"] == product["id"]:
-                device["product"] = product
+    products_by_id = {product["id"]: product for product in products}
+    for device in devices:
+        product = products_by_id.get(device["productId"])
+        if product is not None:
+            device["product"] = product
+        if model_id := device.get("modelId") or (product or {}).get("modelId"):
+            device["_manufacturer"], device["_model"] = parse_model_id(model_id)
 
     session = async_get_clientsession(hass)
-    client = AidotClient(session, token=entry.data[CONF_LOGIN_INFO])
+    client = AidotClient(session, token=login_info)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    domain_data[entry.entry_id] = {
         "client": client,
         "devices": devices,
+        "login_info": login_info,
+        "products": products,
     }
 
     manual_ips = entry.data.get(CONF_MANUAL_IPS)
     if manual_ips:
-        _LOGGER.debug(f"Applying manual IPs: {manual_ips}")
-        for device in devices:
-            dev_id = device.get("id")
-            if dev_id in manual_ips:
-                ip_address = manual_ips[dev_id]
-                if ip_address:
-                    _LOGGER.debug(f"Applying manual IP {ip_address} to device {dev_id}")
-                    device_client = client.get_device_client(device)
-                    device_client.update_ip_address(ip_address, manual=True)
-
+        _LOGGER.debug("Applying manual IPs: %s", manual_ips)
+        updates = [
+            (client.get_device_client(device), ip_address)
+            for device in devices
+            if (ip_address := manual_ips.get(device.get("id")))
+        ]
+        for device_client, ip_address in updates:
+            _LOGGER.debug(
+                "Applying manual IP %s to device %s", ip_address, device_client.device_id
+            )
+            device_client.update_ip_address(ip_address, manual=True)
+
+    # Discovery broadcasts run in the background while the coordinator's first
+    # refresh connects to every device with a known IP concurrently.
     client.start_discover()
 
+    coordinator = AidotCoordinator(hass, client, devices)
+    await coordinator.async_config_entry_first_refresh()
+    domain_data[entry.entry_id]["coordinator"] = coordinator
+    entry.async_on_unload(coordinator.async_subscribe())
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -77,9 +92,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id)
         client: AidotClient = data["client"]
-        client.cleanup()
-        hass.data[DOMAIN].pop(CONF_DEVICE_LIST, None)
-        hass.data[DOMAIN].pop(CONF_LOGIN_INFO, None)
-        hass.data[DOMAIN].pop(CONF_PRODUCT_LIST, None)
+        await client.async_cleanup()
 
     return unload_ok
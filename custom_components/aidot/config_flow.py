@@ -58,11 +58,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
             try:
                 self.login_info = await self.client.async_post_login()
-                _LOGGER.debug(f"Login successful, login_info: {self.login_info}")
+                _LOGGER.debug("Login successful, login_info: %s", self.login_info)
 
                 # get houses
                 self.house_list = await self.client.async_get_houses()
-                _LOGGER.debug(f"Got houses: {self.house_list}")
+                _LOGGER.debug("Got houses: %s", self.house_list)
 
                 return await self.async_step_choose_house()
 
@@ -107,11 +107,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     self.selected_house = item
 
             # get device_list
-            _LOGGER.debug(f"Selected house: {self.selected_house}")
+            _LOGGER.debug("Selected house: %s", self.selected_house)
             self.device_list = await self.client.async_get_devices(
                 self.selected_house["id"]
             )
-            _LOGGER.debug(f"Got devices: {self.device_list}")
+            _LOGGER.debug("Got devices: %s", self.device_list)
 
             # get product_list
             if self.device_list:
@@ -119,19 +119,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     [item["productId"] for item in self.device_list]
                 )
                 self.product_list = await self.client.async_get_products(product_ids)
-                _LOGGER.debug(f"Got products: {self.product_list}")
+                _LOGGER.debug("Got products: %s", self.product_list)
 
             self.device_list = await self.client.async_get_devices(
                 self.selected_house["id"]
             )
-            _LOGGER.debug(f"Got devices: {self.device_list}")
+            _LOGGER.debug("Got devices: %s", self.device_list)
             product_ids = ",".join([d["productId"] for d in self.device_list])
             if product_ids:
-                _LOGGER.debug(
-                    f"Getting product info for product ids: {product_ids}"
-                )
+                _LOGGER.debug("Getting product info for product ids: %s", product_ids)
                 self.product_list = await self.client.async_get_products(product_ids)
-                _LOGGER.debug(f"Got products: {self.product_list}")
+                _LOGGER.debug("Got products: %s", self.product_list)
 
             return await self.async_step_discovery_method()
 
@@ -0,0 +1,131 @@
+"""Coordinator for the AiDot integration."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from aidot.const import CONF_ID
+from aidot.device_client import DeviceStatusData
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+from .helpers import PatchedAidotClient, PatchedDeviceClient
+
+_LOGGER = logging.getLogger(__name__)
+
+SUPPORTED_DEVICE_TYPES = ("light", "switch")
+
+MAX_CONCURRENT_LOGINS = 16
+# The library sets no timeout on the connect or the login reply.
+LOGIN_TIMEOUT = 10
+
+StatusSnapshot = tuple[
+    bool, bool, int | None, int | None, tuple[int, int, int, int] | None
+]
+
+
+def status_snapshot(status: DeviceStatusData) -> StatusSnapshot:
+    """Return the parts of a device status that entities expose."""
+    return (status.online, status.on, status.dimming, status.cct, status.rgbw)
+
+
+class AidotCoordinator(DataUpdateCoordinator[dict[str, StatusSnapshot]]):
+    """Log in to every device of a config entry and dispatch their status frames."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: PatchedAidotClient,
+        devices: list[dict[str, Any]],
+    ) -> None:
+        """Initialize the coordinator."""
+        # Devices push their status over the socket, so there is nothing to poll.
+        super().__init__(hass, _LOGGER, name=DOMAIN)
+        self.devices = [
+            device
+            for device in devices
+            if device.get("type") in SUPPORTED_DEVICE_TYPES
+            and (aes_key := device.get("aesKey"))
+            and aes_key[0] is not None
+        ]
+        self.device_clients: dict[str, PatchedDeviceClient] = {
+            device[CONF_ID]: client.get_device_client(device)
+            for device in self.devices
+        }
+        self._device_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+
+    async def _async_update_data(self) -> dict[str, StatusSnapshot]:
+        """Log in to all devices concurrently and snapshot their status."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOGINS)
+
+        async def _async_login(device_client: PatchedDeviceClient) -> None:
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(device_client.async_login(), LOGIN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # Close the half-open socket; the status loop retries later.
+                    await device_client.reset()
+                    raise
+
+        results = await asyncio.gather(
+            *(
+                _async_login(device_client)
+                for device_client in self.device_clients.values()
+            ),
+            return_exceptions=True,
+        )
+        for device_id, result in zip(self.device_clients, results):
+            if isinstance(result, asyncio.TimeoutError):
+                _LOGGER.warning("Timed out logging in to device %s", device_id)
+            elif isinstance(result, Exception):
+                _LOGGER.warning("Failed to log in to device %s: %s", device_id, result)
+        return {
+            device_id: status_snapshot(device_client.status)
+            for device_id, device_client in self.device_clients.items()
+        }
+
+    @callback
+    def async_subscribe(self) -> Callable[[], None]:
+        """Start listening for status frames; return a function to stop."""
+        unsubs = [
+            device_client.register_status_callback(
+                functools.partial(self._async_handle_status, device_id)
+            )
+            for device_id, device_client in self.device_clients.items()
+        ]
+
+        def _unsubscribe() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _unsubscribe
+
+    @callback
+    def async_add_device_listener(
+        self, device_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call back when one device's status changes; return a function to remove it."""
+        listeners = self._device_listeners.setdefault(device_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @callback
+    def _async_handle_status(self, device_id: str, status: DeviceStatusData) -> None:
+        """Notify the device's entities when its status differs from the last one."""
+        snap = status_snapshot(status)
+        if self.data.get(device_id) == snap:
+            return
+        self.data[device_id] = snap
+        for update_callback in list(self._device_listeners.get(device_id, ())):
+            update_callback()
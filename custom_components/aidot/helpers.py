@@ -1,14 +1,33 @@
 """Helper classes for the AiDot integration."""
 import asyncio
+import contextlib
+import functools
 import logging
+import random
+from collections.abc import Callable
 from typing import Any
 
 from aidot.client import AidotClient
 from aidot.const import CONF_ID
-from aidot.device_client import DeviceClient
+from aidot.device_client import DeviceClient, DeviceStatusData
+from aidot.exceptions import AidotNotLogin
+
+from homeassistant.helpers.device_registry import format_mac
 
 _LOGGER = logging.getLogger(__name__)
 
+RETRY_BACKOFF_MAX = 60
+
+# Entities are rebuilt on every reload; normalize each MAC only once.
+cached_format_mac = functools.lru_cache(maxsize=1024)(format_mac)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_model_id(model_id: str) -> tuple[str, str]:
+    """Split a model id like 'Linkind.LK.light' into manufacturer and model."""
+    manufacturer, _, model = model_id.partition(".")
+    return manufacturer, model
+
 
 class PatchedDeviceClient(DeviceClient):
     """A wrapper for the DeviceClient that includes patches and workarounds."""
@@ -19,19 +38,114 @@ class PatchedDeviceClient(DeviceClient):
         # Fix for 'AttributeError: 'DeviceClient' object has no attribute 'writer''
         self.writer = None
         self.reader = None
+        # Fix for 'AttributeError: 'PatchedDeviceClient' object has no attribute '_ip_address''
+        self._ip_address = None
         self._manual_ip = False
+        self._status_callbacks: list[Callable[[DeviceStatusData], None]] = []
+        self._status_task: asyncio.Task[None] | None = None
+        self._backoff = 1.0
 
     def update_ip_address(self, ip: str, manual: bool = False) -> None:
         """Update the device's IP address, with a lock for manual IPs."""
         if self._manual_ip and not manual:
             _LOGGER.debug(
-                f"Ignoring discovered IP {ip} for {self.device_id} because a manual IP is set."
+                "Ignoring discovered IP %s for %s because a manual IP is set.",
+                ip,
+                self.device_id,
             )
             return
         self._ip_address = ip
         if manual:
             self._manual_ip = True
 
+    def register_status_callback(
+        self, callback: Callable[[DeviceStatusData], None]
+    ) -> Callable[[], None]:
+        """Call back whenever a status frame arrives; return a function to unregister."""
+        self._status_callbacks.append(callback)
+        if self._status_task is None:
+            self._status_task = asyncio.get_running_loop().create_task(
+                self._async_status_loop()
+            )
+            self._status_task.add_done_callback(self._status_task_done)
+
+        def _unregister() -> None:
+            self._status_callbacks.remove(callback)
+            if not self._status_callbacks and self._status_task is not None:
+                self._status_task.cancel()
+                self._status_task = None
+
+        return _unregister
+
+    async def _async_status_loop(self) -> None:
+        """Read status frames pushed by the device and hand them to the callbacks."""
+        read = self.read_status
+        login = self.async_login
+        backoff = self._async_backoff
+        callbacks = self._status_callbacks
+        while True:
+            try:
+                if not self._connect_and_login:
+                    await login()
+                    if not self._connect_and_login:
+                        await backoff()
+                        continue
+                status = await read()
+                if self._connect_and_login and self._reader_failed():
+                    # read_status() logs some stream errors and returns the stale
+                    # status without resetting; treat those as a dropped connection.
+                    await self.reset()
+            except AidotNotLogin:
+                # The connection dropped between the check and the read.
+                await backoff()
+                continue
+            except Exception as e:
+                _LOGGER.error("Error in update loop: %s", e)
+                await backoff()
+                continue
+            for callback in list(callbacks):
+                try:
+                    callback(status)
+                except Exception:
+                    _LOGGER.exception("Error in status callback for %s", self.device_id)
+            if self._connect_and_login:
+                self._backoff = 1.0
+            else:
+                # The read dropped the connection; wait before logging in again.
+                await backoff()
+
+    def _reader_failed(self) -> bool:
+        """Return True if the stream holds an error or has reached EOF."""
+        reader = self.reader
+        return reader is not None and (
+            reader.exception() is not None or reader.at_eof()
+        )
+
+    def _status_task_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a status task that stopped so the next registration restarts it."""
+        if self._status_task is task:
+            self._status_task = None
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _LOGGER.error(
+                "Status loop for %s stopped unexpectedly",
+                self.device_id,
+                exc_info=exc,
+            )
+
+    async def _async_backoff(self) -> None:
+        """Sleep for the current retry delay plus jitter, then double the delay."""
+        await asyncio.sleep(min(self._backoff, RETRY_BACKOFF_MAX) + random.random())
+        self._backoff = min(self._backoff * 2, RETRY_BACKOFF_MAX)
+
+    async def close(self) -> None:
+        """Stop reading status and close the connection."""
+        if (status_task := self._status_task) is not None:
+            self._status_task = None
+            status_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await status_task
+        await super().close()
+
 
 class PatchedAidotClient(AidotClient):
     """A wrapper for the AidotClient that uses our patched device client."""
@@ -55,3 +169,11 @@ class PatchedAidotClient(AidotClient):
                 device_client.update_ip_address(ip)
 
         return device_client
+
+    async def async_cleanup(self) -> None:
+        """Stop discovery and wait for every device client to close."""
+        self.stop_discover()
+        await asyncio.gather(
+            *(device_client.close() for device_client in self._device_clients.values())
+        )
+        self._device_clients.clear()
@@ -2,12 +2,10 @@
 
 import asyncio
 import logging
+from collections.abc import Coroutine
+from functools import cached_property
 from typing import Any
 
-from aidot.client import AidotClient
-from aidot.device_client import DeviceClient
-from aidot.exceptions import AidotNotLogin
-
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_COLOR_TEMP_KELVIN,
@@ -20,101 +18,87 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     DeviceInfo,
-    format_mac,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator import AidotCoordinator
+from .helpers import PatchedDeviceClient, cached_format_mac
 
 _LOGGER = logging.getLogger(__name__)
 
+# (enable_rgbw, enable_cct, enable_dimming) -> supported color modes
+_SUPPORTED_COLOR_MODES: dict[tuple[bool, bool, bool], frozenset[ColorMode]] = {
+    (True, True, True): frozenset({ColorMode.RGBW, ColorMode.COLOR_TEMP}),
+    (True, True, False): frozenset({ColorMode.RGBW, ColorMode.COLOR_TEMP}),
+    (True, False, True): frozenset({ColorMode.RGBW}),
+    (True, False, False): frozenset({ColorMode.RGBW}),
+    (False, True, True): frozenset({ColorMode.COLOR_TEMP}),
+    (False, True, False): frozenset({ColorMode.COLOR_TEMP}),
+    (False, False, True): frozenset({ColorMode.BRIGHTNESS}),
+    (False, False, False): frozenset({ColorMode.ONOFF}),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Light."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    client: AidotClient = data["client"]
-    devices: list[dict[str, Any]] = data["devices"]
+    coordinator: AidotCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    async_add_entities(
-        AidotLight(client, device_info)
-        for device_info in devices
+    lights = [
+        device_info
+        for device_info in coordinator.devices
         if device_info.get("type") == "light"
-        and "aesKey" in device_info
-        and device_info["aesKey"][0] is not None
-    )
+    ]
+    async_add_entities(AidotLight(coordinator, device_info) for device_info in lights)
 
 
-class AidotLight(LightEntity):
+class AidotLight(CoordinatorEntity[AidotCoordinator], LightEntity):
     """Representation of a Aidot Wi-Fi Light."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, client: AidotClient, device: dict[str, Any]) -> None:
+    def __init__(self, coordinator: AidotCoordinator, device: dict[str, Any]) -> None:
         """Initialize the light."""
-        super().__init__()
-        self.device_client: DeviceClient = client.get_device_client(device)
+        super().__init__(coordinator)
+        self.device_client: PatchedDeviceClient = coordinator.device_clients[device["id"]]
+        self._device = device
         self._attr_unique_id = self.device_client.info.dev_id
         self._attr_name = None
-        self._update_task = None
 
-        manufacturer = self.device_client.info.model_id.split(".")[0]
-        model = self.device_client.info.model_id[len(manufacturer) + 1 :]
-        mac = format_mac(self.device_client.info.mac)
-        self._attr_device_info = DeviceInfo(
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device registry information for this light."""
+        info = self.device_client.info
+        return DeviceInfo(
             identifiers={(DOMAIN, self._attr_unique_id)},
-            connections={(CONNECTION_NETWORK_MAC, mac)},
-            manufacturer=manufacturer,
-            model=model,
-            name=self.device_client.info.name,
-            hw_version=self.device_client.info.hw_version,
+            connections={(CONNECTION_NETWORK_MAC, cached_format_mac(info.mac))},
+            manufacturer=self._device.get("_manufacturer"),
+            model=self._device.get("_model"),
+            name=info.name,
+            hw_version=info.hw_version,
         )
 
-        supported_color_modes = set()
-        if self.device_client.info.enable_rgbw:
-            _LOGGER.debug("Adding RGBW")
-            supported_color_modes.add(ColorMode.RGBW)
-
-        if self.device_client.info.enable_cct:
-            _LOGGER.debug("Adding CCT")
-            supported_color_modes.add(ColorMode.COLOR_TEMP)
-
-        if self.device_client.info.enable_dimming and not (
-                self.device_client.info.enable_cct or self.device_client.info.enable_rgbw
-        ):
-            _LOGGER.debug("Adding dimming")
-            supported_color_modes.add(ColorMode.BRIGHTNESS)
-
-        if not supported_color_modes:
-            _LOGGER.debug("No color modes supported")
-            supported_color_modes.add(ColorMode.ONOFF)
-
-        self._attr_supported_color_modes = supported_color_modes
+    @cached_property
+    def supported_color_modes(self) -> frozenset[ColorMode]:
+        """Return the color modes this light supports."""
+        info = self.device_client.info
+        supported_color_modes = _SUPPORTED_COLOR_MODES[
+            (bool(info.enable_rgbw), bool(info.enable_cct), bool(info.enable_dimming))
+        ]
+        _LOGGER.debug("Supported color modes: %s", supported_color_modes)
+        return supported_color_modes
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        await self.device_client.async_login()
-        self._update_task = self.hass.loop.create_task(self._async_update_loop())
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        if self._update_task:
-            self._update_task.cancel()
-        await super().async_will_remove_from_hass()
-
-    async def _async_update_loop(self):
-        """Loop to update status."""
-        while True:
-            try:
-                await self.device_client.read_status()
-                self.async_write_ha_state()
-            except AidotNotLogin:
-                await self.device_client.async_login()
-            except Exception as e:
-                _LOGGER.error(f"Error in update loop: {e}")
-                await asyncio.sleep(5)
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(
+                self._attr_unique_id, self.async_write_ha_state
+            )
+        )
 
     @property
     def available(self) -> bool:
@@ -164,15 +148,19 @@ class AidotLight(LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
+        coros: list[Coroutine[Any, Any, None]] = []
         if not self.is_on:
-            await self.device_client.async_turn_on()
-
+            coros.append(self.device_client.async_turn_on())
         if ATTR_BRIGHTNESS in kwargs:
-            await self.device_client.async_set_brightness(kwargs[ATTR_BRIGHTNESS])
+            coros.append(self.device_client.async_set_brightness(kwargs[ATTR_BRIGHTNESS]))
         if ATTR_COLOR_TEMP_KELVIN in kwargs:
-            await self.device_client.async_set_cct(kwargs[ATTR_COLOR_TEMP_KELVIN])
+            coros.append(self.device_client.async_set_cct(kwargs[ATTR_COLOR_TEMP_KELVIN]))
         if ATTR_RGBW_COLOR in kwargs:
-            await self.device_client.async_set_rgbw(kwargs[ATTR_RGBW_COLOR])
+            coros.append(self.device_client.async_set_rgbw(kwargs[ATTR_RGBW_COLOR]))
+
+        # Each command is written to the socket before its first await, so the
+        # device still receives them in this order.
+        await asyncio.gather(*coros)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
@@ -1,24 +1,22 @@
 """Support for AiDot switches."""
 
-import asyncio
 import logging
+from functools import cached_property
 from typing import Any
 
-from aidot.client import AidotClient
-from aidot.device_client import DeviceClient
-from aidot.exceptions import AidotNotLogin
-
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     DeviceInfo,
-    format_mac,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator import AidotCoordinator
+from .helpers import PatchedDeviceClient, cached_format_mac
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,67 +25,50 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Switch."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    client: AidotClient = data["client"]
-    devices: list[dict[str, Any]] = data["devices"]
+    coordinator: AidotCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    async_add_entities(
-        AidotSwitch(client, device_info)
-        for device_info in devices
+    switches = [
+        device_info
+        for device_info in coordinator.devices
         if device_info.get("type") == "switch"
-        and "aesKey" in device_info
-        and device_info["aesKey"][0] is not None
-    )
+    ]
+    async_add_entities(AidotSwitch(coordinator, device_info) for device_info in switches)
 
 
-class AidotSwitch(SwitchEntity):
+class AidotSwitch(CoordinatorEntity[AidotCoordinator], SwitchEntity):
     """Representation of a Aidot Wi-Fi Switch."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, client: AidotClient, device: dict[str, Any]) -> None:
+    def __init__(self, coordinator: AidotCoordinator, device: dict[str, Any]) -> None:
         """Initialize the switch."""
-        super().__init__()
-        self.device_client: DeviceClient = client.get_device_client(device)
+        super().__init__(coordinator)
+        self.device_client: PatchedDeviceClient = coordinator.device_clients[device["id"]]
+        self._device = device
         self._attr_unique_id = self.device_client.info.dev_id
         self._attr_name = None
-        self._update_task = None
 
-        manufacturer = self.device_client.info.model_id.split(".")[0]
-        model = self.device_client.info.model_id[len(manufacturer) + 1 :]
-        mac = format_mac(self.device_client.info.mac)
-        self._attr_device_info = DeviceInfo(
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device registry information for this switch."""
+        info = self.device_client.info
+        return DeviceInfo(
             identifiers={(DOMAIN, self._attr_unique_id)},
-            connections={(CONNECTION_NETWORK_MAC, mac)},
-            manufacturer=manufacturer,
-            model=model,
-            name=self.device_client.info.name,
-            hw_version=self.device_client.info.hw_version,
+            connections={(CONNECTION_NETWORK_MAC, cached_format_mac(info.mac))},
+            manufacturer=self._device.get("_manufacturer"),
+            model=self._device.get("_model"),
+            name=info.name,
+            hw_version=info.hw_version,
         )
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        await self.device_client.async_login()
-        self._update_task = self.hass.loop.create_task(self._async_update_loop())
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        if self._update_task:
-            self._update_task.cancel()
-        await super().async_will_remove_from_hass()
-
-    async def _async_update_loop(self):
-        """Loop to update status."""
-        while True:
-            try:
-                await self.device_client.read_status()
-                self.async_write_ha_state()
-            except AidotNotLogin:
-                await self.device_client.async_login()
-            except Exception as e:
-                _LOGGER.error(f"Error in update loop: {e}")
-                await asyncio.sleep(5)
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(
+                self._attr_unique_id, self.async_write_ha_state
+            )
+        )
 
     @property
     def available(self) -> bool: